@@ -21,19 +21,20 @@ Usage:
 import sys
 import signal
 import argparse
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-# Terminal interface imports
-from src.agent import FinanceAgent
-from src.terminal_interface import TerminalInterface
-
-# Telegram interface imports
-from src.telegram_interface import TelegramInterface
+from dotenv import load_dotenv
 
 # Shared modules
 from src.config import AppConfig, ConfigurationError
 from src.feedback import MessageFormatter
 
+if TYPE_CHECKING:
+    from src.agent import FinanceAgent
+
+# Signal handlers only need to be installed once per process
+_HANDLERS_INSTALLED = False
+
 
 def signal_handler(signum: int, frame) -> None:
     """
@@ -47,7 +48,7 @@ def signal_handler(signum: int, frame) -> None:
     sys.exit(0)
 
 
-def initialize_agent(verbose: bool = False) -> Optional[FinanceAgent]:
+def initialize_agent(verbose: bool = False) -> Optional["FinanceAgent"]:
     """
     Initialize the Finance Agent with error handling.
 
@@ -57,6 +58,8 @@ def initialize_agent(verbose: bool = False) -> Optional[FinanceAgent]:
     Returns:
         FinanceAgent instance, or None if initialization fails
     """
+    from src.agent import FinanceAgent
+
     try:
         agent = FinanceAgent(model="gpt-3.5-turbo", verbose=verbose)
         return agent
@@ -110,12 +113,18 @@ def main() -> None:
     and routes to the appropriate interface based on user selection. Handles
     graceful shutdown on system signals.
     """
+    # Parse command line arguments first so --help exits without further setup
+    args = parse_arguments()
+
     # Register signal handlers for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    global _HANDLERS_INSTALLED
+    if not _HANDLERS_INSTALLED:
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+        _HANDLERS_INSTALLED = True
 
-    # Parse command line arguments
-    args = parse_arguments()
+    # Load .env before validating so the checks see the same environment the agent will
+    load_dotenv()
 
     # Validate interface selection and environment configuration
     try:
@@ -135,11 +144,16 @@ def main() -> None:
         )
         sys.exit(1)
 
-    # Route to appropriate interface
+    # Route to appropriate interface (imported lazily so only the selected
+    # interface's dependencies are loaded)
     if args.interface == "terminal":
+        from src.terminal_interface import TerminalInterface
+
         terminal = TerminalInterface(use_colors=True)
         terminal.run(agent, args.verbose)
     elif args.interface == "telegram":
+        from src.telegram_interface import TelegramInterface
+
         telegram = TelegramInterface()
         telegram.run(agent)
     else:
@@ -21,12 +21,28 @@ __version__ = "1.0.0"
 __author__ = "Finance Tracker Agent Team"
 
 # Core exports
-from .agent import FinanceAgent
 from .config import AppConfig, ConfigurationError
-from .terminal_interface import TerminalInterface
-from .telegram_interface import TelegramInterface
 from .feedback import MessageFormatter
 
+# The agent and interface modules are imported on first access (PEP 562) so
+# that `import src` does not pull in LangChain or the Telegram SDK.
+_LAZY_EXPORTS = {
+    "FinanceAgent": ".agent",
+    "TerminalInterface": ".terminal_interface",
+    "TelegramInterface": ".telegram_interface",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "FinanceAgent",
     "AppConfig",
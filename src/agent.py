@@ -8,26 +8,123 @@ configuration, and execution for the personal finance tracker.
 import traceback
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain.agents import AgentExecutor, create_openai_functions_agent
-from langchain_core.prompts import ChatPromptTemplate
+
 from dotenv import load_dotenv
 
-from src.tools import (
-    save_expense_tool,
-    get_current_date_tool,
-    get_current_month_tool,
-    get_all_expenses,
-    get_allowed_categories,
-    get_monthly_expenses,
-    update_last_expense_attribute,
-    get_spendings_by_year_and_month,
-    get_spendings_by_category_for_specific_month,
-    get_spendings_by_main_and_subcategory_for_specific_month,
-    get_spendings_by_account_for_specific_month,
-)
-from src.prompts import openai_functions_agent_prompt
+
+class _LazyTraceback:
+    """
+    Formatted traceback of an exception, rendered only when converted to str.
+
+    Most callers never display the full traceback, so the (deep) LangChain stack
+    is only walked and formatted on first use, and the result is memoized.
+    """
+
+    __slots__ = ("exc", "_formatted")
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+        self._formatted: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._formatted is None:
+            self._formatted = "".join(
+                traceback.format_exception(
+                    type(self.exc), self.exc, self.exc.__traceback__
+                )
+            )
+        return self._formatted
+
+    def __repr__(self) -> str:
+        return f"_LazyTraceback({self.exc!r})"
+
+
+@dataclass(slots=True)
+class AgentResult:
+    """
+    Result of a single agent request.
+
+    Attributes:
+        success: Boolean indicating if execution was successful
+        output: Agent's response or error message
+        error: Error details if execution failed (formatted traceback
+            rendered lazily on str())
+    """
+
+    success: bool
+    output: str
+    error: Any = None
+
+    def __getitem__(self, key: str) -> Any:
+        """Allow dict-style access (result["output"]) for backward compatibility."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+@lru_cache(maxsize=1)
+def _load_tools() -> tuple:
+    """
+    Import the agent tools and return them as an immutable tuple.
+
+    The tools are static, so the tuple is built once per process and shared by
+    every FinanceAgent instance.
+    """
+    from src.tools import (
+        save_expense_tool,
+        get_current_date_tool,
+        get_current_month_tool,
+        get_all_expenses,
+        get_allowed_categories,
+        get_monthly_expenses,
+        update_last_expense_attribute,
+        get_spendings_by_year_and_month,
+        get_spendings_by_category_for_specific_month,
+        get_spendings_by_main_and_subcategory_for_specific_month,
+        get_spendings_by_account_for_specific_month,
+    )
+
+    return (
+        save_expense_tool,
+        get_current_date_tool,
+        get_current_month_tool,
+        get_monthly_expenses,
+        get_all_expenses,
+        update_last_expense_attribute,
+        get_spendings_by_year_and_month,
+        get_allowed_categories,
+        get_spendings_by_category_for_specific_month,
+        get_spendings_by_main_and_subcategory_for_specific_month,
+        get_spendings_by_account_for_specific_month,
+    )
+
+
+@lru_cache(maxsize=4)
+def _build_agent(model: str, api_key: str) -> tuple:
+    """
+    Create the chat model and the OpenAI functions agent for a model.
+
+    Deriving the function schemas from the tools is the expensive part of agent
+    construction; the result only depends on the model and API key, so it is
+    cached and reused by later FinanceAgent instances.
+
+    Returns:
+        Tuple of (llm, agent runnable)
+    """
+    from langchain_openai import ChatOpenAI
+    from langchain.agents import create_openai_functions_agent
+
+    from src.prompts import get_openai_functions_agent_prompt
+
+    llm = ChatOpenAI(model=model, api_key=api_key)
+    agent = create_openai_functions_agent(
+        llm, _load_tools(), get_openai_functions_agent_prompt()
+    )
+    return llm, agent
 
 
 class FinanceAgent:
@@ -40,34 +137,27 @@ class FinanceAgent:
     """
 
     def __init__(self, model: str = "gpt-3.5-turbo", verbose: bool = False):
-
+        # Direct users (e.g. notebooks) rely on .env; existing variables are not overridden
         load_dotenv()
 
+        # LangChain and the tool modules are heavy to import, so they are only
+        # loaded once an agent is actually constructed (see _build_agent).
+        from langchain.agents import AgentExecutor
+
+        from src.prompts import get_openai_functions_agent_prompt
+
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError(
                 "OpenAI API key not found. Please set OPENAI_API_KEY environment variable."
             )
 
-        self.llm = ChatOpenAI(model=model, api_key=api_key)
-
-        self.tools = [
-            save_expense_tool,
-            get_current_date_tool,
-            get_current_month_tool,
-            get_monthly_expenses,
-            get_all_expenses,
-            update_last_expense_attribute,
-            get_spendings_by_year_and_month,
-            get_allowed_categories,
-            get_spendings_by_category_for_specific_month,
-            get_spendings_by_main_and_subcategory_for_specific_month,
-            get_spendings_by_account_for_specific_month,
-        ]
-
-        self.prompt = openai_functions_agent_prompt
-
-        self.agent = create_openai_functions_agent(self.llm, self.tools, self.prompt)
+        self.llm, self.agent = _build_agent(model, api_key)
+
+        self.tools = _load_tools()
+
+        self.prompt = get_openai_functions_agent_prompt()
+
         self.agent_executor = AgentExecutor(
             agent=self.agent,
             tools=self.tools,
@@ -75,7 +165,7 @@ class FinanceAgent:
             handle_parsing_errors=True,
         )
 
-    def execute_request(self, user_input: str) -> Dict[str, Any]:
+    def execute_request(self, user_input: str) -> AgentResult:
         """
         Process a user request and return the agent's response.
 
@@ -83,38 +173,28 @@ class FinanceAgent:
             user_input: Natural language input from the user
 
         Returns:
-            Dictionary containing:
-                - success: Boolean indicating if execution was successful
-                - output: Agent's response or error message
-                - error: Error details if execution failed
+            AgentResult with the success flag, the agent's output and, on
+            failure, the error details
 
         Example:
             >>> agent = FinanceAgent()
             >>> result = agent.execute_request("Add new expense in a restaurant 56 euros today")
-            >>> print(result['output'])
+            >>> print(result.output)
         """
         try:
             # Execute the agent with user input
             result = self.agent_executor.invoke({"input": user_input})
 
-            return {
-                "success": True,
-                "output": result.get("output", "No output received"),
-                "error": None,
-            }
+            return AgentResult(True, result.get("output", "No output received"))
 
         except Exception as e:
-            # Handle agent execution errors
-            error_message = "".join(
-                traceback.format_exception(type(e), e, e.__traceback__)
+            # Handle agent execution errors; the traceback is formatted on demand
+            return AgentResult(
+                False,
+                "I encountered an error while processing your request. Please try again or rephrase your request.",
+                error=_LazyTraceback(e),
             )
 
-            return {
-                "success": False,
-                "output": "I encountered an error while processing your request. Please try again or rephrase your request.",
-                "error": error_message,
-            }
-
     def get_available_tools(self) -> list[str]:
         """
         Get list of available tool names.
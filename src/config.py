@@ -6,8 +6,12 @@ Provides a single source of truth for application configuration with proper erro
 """
 
 import os
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
+_VALID_INTERFACES = frozenset({"terminal", "telegram"})
+_VALID_INTERFACES_STR = ", ".join(sorted(_VALID_INTERFACES))
+
 
 class ConfigurationError(Exception):
     """Raised when there's a configuration issue with environment variables."""
@@ -15,6 +19,34 @@ class ConfigurationError(Exception):
     pass
 
 
+# Environment values are fixed for the lifetime of the process, so successful
+# lookups are cached. Failures raise and are therefore never cached.
+@lru_cache(maxsize=1)
+def _openai_api_key() -> str:
+    api_key = os.getenv("OPENAI_API_KEY", "").strip()
+    if not api_key:
+        raise ConfigurationError(
+            "OpenAI API key not found. Please set OPENAI_API_KEY environment variable."
+        )
+    return api_key
+
+
+@lru_cache(maxsize=1)
+def _telegram_token() -> str:
+    token = os.getenv("TG_TOKEN", "").strip()
+    if not token:
+        raise ConfigurationError(
+            "TG_TOKEN environment variable is required for Telegram interface"
+        )
+    return token
+
+
+def _reset_cache() -> None:
+    """Clear cached environment lookups (e.g. after changing env vars in tests)."""
+    _openai_api_key.cache_clear()
+    _telegram_token.cache_clear()
+
+
 class AppConfig:
     """
     Application configuration manager.
@@ -34,12 +66,7 @@ class AppConfig:
         Raises:
             ConfigurationError: If API key is not found or empty
         """
-        api_key = os.getenv("OPENAI_API_KEY", "").strip()
-        if not api_key:
-            raise ConfigurationError(
-                "OpenAI API key not found. Please set OPENAI_API_KEY environment variable."
-            )
-        return api_key
+        return _openai_api_key()
 
     @staticmethod
     def get_telegram_token() -> str:
@@ -52,12 +79,7 @@ class AppConfig:
         Raises:
             ConfigurationError: If token is not found or empty
         """
-        token = os.getenv("TG_TOKEN", "").strip()
-        if not token:
-            raise ConfigurationError(
-                "TG_TOKEN environment variable is required for Telegram interface"
-            )
-        return token
+        return _telegram_token()
 
     @staticmethod
     def validate_environment(interface_type: str = "terminal") -> Dict[str, Any]:
@@ -108,10 +130,9 @@ class AppConfig:
         Raises:
             ConfigurationError: If interface is not supported
         """
-        valid_interfaces = {"terminal", "telegram"}
-        if interface not in valid_interfaces:
+        if interface not in _VALID_INTERFACES:
             raise ConfigurationError(
                 f"Unsupported interface: {interface}. "
-                f"Valid options are: {', '.join(sorted(valid_interfaces))}"
+                f"Valid options are: {_VALID_INTERFACES_STR}"
             )
         return interface
@@ -5,7 +5,10 @@ Shared error handling patterns and utilities for the Finance Tracker Agent.
 Provides consistent error processing across different interfaces.
 """
 
-from typing import Dict, Any, Tuple, Optional
+from typing import Any, Tuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent import AgentResult
 
 
 class AgentErrorHandler:
@@ -18,27 +21,22 @@ class AgentErrorHandler:
 
     @staticmethod
     def process_agent_response(
-        response: Dict[str, Any],
-    ) -> Tuple[str, bool, Optional[str]]:
+        response: "AgentResult",
+    ) -> Tuple[str, bool, Optional[Any]]:
         """
         Process agent response and extract relevant information.
 
         Args:
-            response: Agent response dictionary containing success status and output
+            response: Agent result containing success status and output
 
         Returns:
             Tuple of (output_message, is_success, error_details)
         """
-        success = response.get("success", False)
-
-        if success:
-            output = response.get("output", "Request completed successfully")
-            return output, True, None
+        if response.success:
+            return response.output, True, None
         else:
             # Handle error response
-            output = response.get("output", "An error occurred")
-            error = response.get("error")
-            return output, False, error
+            return response.output, False, response.error
 
     @staticmethod
     def format_error_details(error: Any, max_length: int = 200) -> str:
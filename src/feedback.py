@@ -7,93 +7,127 @@ Provides standardized message formatting across different interfaces.
 
 from typing import Optional
 
+# Standard emoji patterns
+SUCCESS_EMOJI = "✅"
+ERROR_EMOJI = "❌"
+WARNING_EMOJI = "⚠️"
+INFO_EMOJI = "💡"
+TECHNICAL_EMOJI = "🔧"
 
-class MessageFormatter:
+# (character, escaped) pairs for Telegram MarkdownV2. Chained str.replace calls,
+# skipping characters that are absent, measure faster than str.translate or re.sub.
+_MDV2_ESCAPES = tuple((char, f"\\{char}") for char in r"_*[]()~`>#+-=|{}.!")
+
+
+def escape_markdown_v2(text: str) -> str:
     """
-    Standardized message formatting for user feedback.
+    Escape special characters for Telegram MarkdownV2 format.
 
-    Provides consistent emoji usage, message structure, and
-    formatting patterns across terminal and Telegram interfaces.
+    Args:
+        text: The text to escape
+
+    Returns:
+        Escaped text safe for MarkdownV2 parsing
     """
+    for char, escaped in _MDV2_ESCAPES:
+        if char in text:
+            text = text.replace(char, escaped)
+    return text
 
-    # Standard emoji patterns
-    SUCCESS_EMOJI = "✅"
-    ERROR_EMOJI = "❌"
-    WARNING_EMOJI = "⚠️"
-    INFO_EMOJI = "💡"
-    TECHNICAL_EMOJI = "🔧"
 
-    @staticmethod
-    def success_message(message: str) -> str:
-        """
-        Format a success message.
+def success_message(message: str) -> str:
+    """
+    Format a success message.
 
-        Args:
-            message: Success message content
+    Args:
+        message: Success message content
 
-        Returns:
-            Formatted success message
-        """
-        return f"{MessageFormatter.SUCCESS_EMOJI} {message}"
+    Returns:
+        Formatted success message
+    """
+    return f"{SUCCESS_EMOJI} {message}"
 
-    @staticmethod
-    def error_message(message: str, technical_details: Optional[str] = None) -> str:
-        """
-        Format an error message with optional technical details.
 
-        Args:
-            message: Main error message
-            technical_details: Optional technical error details
+def error_message(message: str, technical_details: Optional[str] = None) -> str:
+    """
+    Format an error message with optional technical details.
 
-        Returns:
-            Formatted error message
-        """
-        formatted = f"{MessageFormatter.ERROR_EMOJI} {message}"
+    Args:
+        message: Main error message
+        technical_details: Optional technical error details
 
-        if technical_details:
-            formatted += f"\n\n{MessageFormatter.TECHNICAL_EMOJI} Technical details: {technical_details}"
+    Returns:
+        Formatted error message
+    """
+    if technical_details:
+        return (
+            f"{ERROR_EMOJI} {message}\n\n"
+            f"{TECHNICAL_EMOJI} Technical details: {technical_details}"
+        )
+    return f"{ERROR_EMOJI} {message}"
 
-        return formatted
 
-    @staticmethod
-    def warning_message(message: str) -> str:
-        """
-        Format a warning message.
+def warning_message(message: str) -> str:
+    """
+    Format a warning message.
 
-        Args:
-            message: Warning message content
+    Args:
+        message: Warning message content
 
-        Returns:
-            Formatted warning message
-        """
-        return f"{MessageFormatter.WARNING_EMOJI} {message}"
+    Returns:
+        Formatted warning message
+    """
+    return f"{WARNING_EMOJI} {message}"
 
-    @staticmethod
-    def info_message(message: str) -> str:
-        """
-        Format an informational message.
 
-        Args:
-            message: Info message content
+def info_message(message: str) -> str:
+    """
+    Format an informational message.
 
-        Returns:
-            Formatted info message
-        """
-        return f"{MessageFormatter.INFO_EMOJI} {message}"
+    Args:
+        message: Info message content
 
-    @staticmethod
-    def configuration_error_message(error_msg: str, suggestion: str) -> str:
-        """
-        Format a configuration error with helpful suggestion.
+    Returns:
+        Formatted info message
+    """
+    return f"{INFO_EMOJI} {message}"
 
-        Args:
-            error_msg: Configuration error message
-            suggestion: Helpful suggestion for user
 
-        Returns:
-            Formatted configuration error message
-        """
-        return f"{MessageFormatter.error_message(error_msg)}\n{MessageFormatter.info_message(suggestion)}"
+def configuration_error_message(error_msg: str, suggestion: str) -> str:
+    """
+    Format a configuration error with helpful suggestion.
+
+    Args:
+        error_msg: Configuration error message
+        suggestion: Helpful suggestion for user
+
+    Returns:
+        Formatted configuration error message
+    """
+    return f"{ERROR_EMOJI} {error_msg}\n{INFO_EMOJI} {suggestion}"
+
+
+class MessageFormatter:
+    """
+    Standardized message formatting for user feedback.
+
+    Provides consistent emoji usage, message structure, and
+    formatting patterns across terminal and Telegram interfaces.
+    Kept for backward compatibility; forwards to the module-level functions.
+    """
+
+    # Aliases of the module-level constants
+    SUCCESS_EMOJI = SUCCESS_EMOJI
+    ERROR_EMOJI = ERROR_EMOJI
+    WARNING_EMOJI = WARNING_EMOJI
+    INFO_EMOJI = INFO_EMOJI
+    TECHNICAL_EMOJI = TECHNICAL_EMOJI
+
+    success_message = staticmethod(success_message)
+    error_message = staticmethod(error_message)
+    warning_message = staticmethod(warning_message)
+    info_message = staticmethod(info_message)
+    configuration_error_message = staticmethod(configuration_error_message)
 
 
 class WelcomeMessages:
@@ -155,3 +189,6 @@ I understand natural language and can help you:
 
 Let's get started with tracking your finances\\! 💰
 """
+
+    # Escaped once at import time; sent as-is on every /start
+    TELEGRAM_WELCOME_ESCAPED = escape_markdown_v2(TELEGRAM_WELCOME)
@@ -1,5 +1,6 @@
-from src.schema import MainCategory, SubCategory
-from langchain_core.prompts import ChatPromptTemplate
+from functools import lru_cache
+
+from src.schema import MAIN_CATEGORIES, SUB_CATEGORIES
 
 react_system_prompt = f"""
 
@@ -18,8 +19,8 @@ save_expense:
   - Parameters (you must extract/infer these from the user input. When no):
     - 'year' (int): Year of the expense. If not specified, defaults to None.
     - 'month' (int): Month of the expense (1-12). If not specified, defaults to None.
-    - 'main_category' (str): Main category of the expense (defaults to Other). One of the following: {[e.value for e in MainCategory]}.
-    - 'sub_category' (str): Sub-category of the expense (defaults to Other). One of the following: {[e.value for e in SubCategory]}.
+    - 'main_category' (str): Main category of the expense (defaults to Other). One of the following: {list(MAIN_CATEGORIES)}.
+    - 'sub_category' (str): Sub-category of the expense (defaults to Other). One of the following: {list(SUB_CATEGORIES)}.
     - 'account' (str): Account used (e.g., Main Account, Food Account). Defaults to 'Main Account'.
     - 'amount' (float): Amount spent (must be positive).
     - 'note' (str, optional): Optional note (defaults to ''). If not specified, defaults to ''.
@@ -112,11 +113,21 @@ Thought:{agent_scratchpad}
 """
 
 
-openai_functions_agent_prompt = ChatPromptTemplate.from_messages(
-    [
-        (
-            "system",
-            """You are a financial expense tracking assistant. You can:
+@lru_cache(maxsize=1)
+def get_openai_functions_agent_prompt():
+    """
+    Build the OpenAI functions agent prompt once per process.
+
+    LangChain is imported here rather than at module level so that importing
+    the prompt strings does not pay the LangChain import cost.
+    """
+    from langchain_core.prompts import ChatPromptTemplate
+
+    return ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                """You are a financial expense tracking assistant. You can:
 
 1. **Save new expenses**: Use the save_expense_tool to record NEW expenses
 2. **Correct last expense categories**: Use the update_last_expense_categories_tool when the user wants to MODIFY the categories of the most recently saved expense
@@ -151,8 +162,15 @@ openai_functions_agent_prompt = ChatPromptTemplate.from_messages(
 - "Record dinner for $25"
 
 The tools return detailed attribute information that the user wants to see.""",
-        ),
-        ("user", "{input}"),
-        ("assistant", "{agent_scratchpad}"),
-    ]
-)
+            ),
+            ("user", "{input}"),
+            ("assistant", "{agent_scratchpad}"),
+        ]
+    )
+
+
+def __getattr__(name):
+    # Backward compatible module attribute, built on first access (PEP 562)
+    if name == "openai_functions_agent_prompt":
+        return get_openai_functions_agent_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,7 @@ import csv
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MainCategory(str, Enum):
@@ -22,6 +22,11 @@ class MainCategory(str, Enum):
     VARIABLE = "Variable"  # Flexible discretionary spending
 
 
+# Category values in definition order, and as a set for cheap membership checks
+MAIN_CATEGORIES = tuple(e.value for e in MainCategory)
+MAIN_CATEGORY_VALUES = frozenset(MAIN_CATEGORIES)
+
+
 class SubCategory(str, Enum):
     """Detailed subcategories for expense classification"""
 
@@ -83,6 +88,10 @@ class SubCategory(str, Enum):
     FITNESS = "Fitness"  # Gym, personal training, fitness equipment
 
 
+SUB_CATEGORIES = tuple(e.value for e in SubCategory)
+SUB_CATEGORY_VALUES = frozenset(SUB_CATEGORIES)
+
+
 class Account(str, Enum):
     """Account types for expense tracking"""
 
@@ -93,6 +102,10 @@ class Account(str, Enum):
 class ExpenseInput(BaseModel):
     """Input model for recording financial expenses with intelligent defaults"""
 
+    # Immutable once validated; enum fields (defaults included) hold their plain
+    # string values so callers and serialization skip the `.value` lookups
+    model_config = ConfigDict(frozen=True, use_enum_values=True, validate_default=True)
+
     year: int = Field(
         default_factory=lambda: datetime.now().year, description="Year of the expense"
     )
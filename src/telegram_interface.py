@@ -8,19 +8,22 @@ integration with shared error handling and configuration management.
 
 Features:
     - Full Telegram Bot API integration
-    - MarkdownV2 message formatting with proper escaping
+    - Plain-text replies with a MarkdownV2 welcome message
     - Shared error handling and message formatting
     - Production-ready bot lifecycle management
     - Graceful shutdown handling
 """
 
+import asyncio
 import sys
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Dict, Optional, TYPE_CHECKING
 
 from telegram import Update
 from telegram.ext import (
     Application,
     ApplicationBuilder,
+    BaseUpdateProcessor,
     CommandHandler,
     MessageHandler,
     filters,
@@ -30,11 +33,54 @@ from telegram.constants import ParseMode
 
 from .config import AppConfig, ConfigurationError
 from .error_handler import AgentErrorHandler
-from .feedback import MessageFormatter, WelcomeMessages
+from .feedback import MessageFormatter, WelcomeMessages, escape_markdown_v2
 
 if TYPE_CHECKING:
     from .agent import FinanceAgent
 
+_STARTUP_BANNER = (
+    "🤖 Telegram bot is running...\n"
+    + MessageFormatter.info_message(
+        "Send messages to your bot to interact with the Finance Agent"
+    )
+    + "\n🔄 Press Ctrl+C to stop the bot\n"
+)
+
+
+class _PerChatUpdateProcessor(BaseUpdateProcessor):
+    """
+    Update processor that runs different chats concurrently but keeps each chat in order.
+
+    The tools share one CSV and act on "the last expense", so a follow-up message
+    (e.g. "actually make it 13€") must not overtake the request it refers to.
+    """
+
+    __slots__ = ("_chat_locks",)
+
+    def __init__(self, max_concurrent_updates: int):
+        super().__init__(max_concurrent_updates)
+        self._chat_locks: Dict[int, asyncio.Lock] = {}
+
+    async def do_process_update(
+        self, update: object, coroutine: Awaitable[Any]
+    ) -> None:
+        """Await the update's coroutine while holding its chat's lock."""
+        chat = getattr(update, "effective_chat", None)
+        if chat is None:
+            await coroutine
+            return
+
+        lock = self._chat_locks.setdefault(chat.id, asyncio.Lock())
+        async with lock:
+            await coroutine
+
+    async def initialize(self) -> None:
+        """Nothing to set up."""
+
+    async def shutdown(self) -> None:
+        """Drop the per-chat locks."""
+        self._chat_locks.clear()
+
 
 class TelegramInterface:
     """
@@ -46,43 +92,31 @@ class TelegramInterface:
 
     Features:
         - Complete Telegram Bot API integration with proper message handling
-        - MarkdownV2 formatting with comprehensive character escaping
+        - Plain-text replies, with MarkdownV2 only for the pre-escaped welcome
         - Shared error handling and response processing
         - Production-ready bot lifecycle and shutdown management
         - Integration with unified configuration validation
     """
 
-    def __init__(self):
-        """Initialize the Telegram interface."""
-        self.agent = None
-
-    def escape_markdown_v2(self, text: str) -> str:
+    def __init__(self, max_workers: int = 4):
         """
-        Escape special characters for Telegram MarkdownV2 format.
+        Initialize the Telegram interface.
 
         Args:
-            text: The text to escape
-
-        Returns:
-            Escaped text safe for MarkdownV2 parsing
+            max_workers: Maximum number of agent requests processed concurrently
         """
-        # Characters that need to be escaped in MarkdownV2
-        escape_chars = r"_*[]()~`>#+-=|{}.!"
-
-        # Escape each character
-        escaped_text = text
-        for char in escape_chars:
-            escaped_text = escaped_text.replace(char, f"\\{char}")
+        self.agent = None
+        self.max_workers = max_workers
+        self.executor: Optional[ThreadPoolExecutor] = None
 
-        return escaped_text
+    # Shared MarkdownV2 escaping, kept as a method for existing callers
+    escape_markdown_v2 = staticmethod(escape_markdown_v2)
 
     async def start_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command for Telegram bot."""
-        # Use shared welcome message
-        welcome_message = WelcomeMessages.TELEGRAM_WELCOME
-
+        # Use shared welcome message, escaped once at import time
         await update.message.reply_text(
-            self.escape_markdown_v2(welcome_message), parse_mode=ParseMode.MARKDOWN_V2
+            WelcomeMessages.TELEGRAM_WELCOME_ESCAPED, parse_mode=ParseMode.MARKDOWN_V2
         )
 
     async def message_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -90,8 +124,12 @@ class TelegramInterface:
         user_message = update.message.text
 
         try:
-            # Process request through agent
-            result = self.agent.execute_request(user_message)
+            # Process request through agent in a worker thread so the event loop
+            # keeps serving other users during the LLM round-trip
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self.executor, self.agent.execute_request, user_message
+            )
 
             # Use shared error handler to process response
             output, is_success, error = AgentErrorHandler.process_agent_response(result)
@@ -109,25 +147,14 @@ class TelegramInterface:
                 else:
                     response = MessageFormatter.error_message(output)
 
-            # Escape the response for MarkdownV2 and send
-            escaped_response = self.escape_markdown_v2(response)
-            await update.message.reply_text(
-                escaped_response, parse_mode=ParseMode.MARKDOWN_V2
-            )
+            # Replies are sent as plain text: fully escaped MarkdownV2 renders
+            # identically, so escaping would be wasted work
+            await update.message.reply_text(response)
 
-        except KeyboardInterrupt:
-            print("\n⚠️ Request interrupted.")
-            error_msg = AgentErrorHandler.handle_keyboard_interrupt()
-            await update.message.reply_text(
-                self.escape_markdown_v2(error_msg), parse_mode=ParseMode.MARKDOWN_V2
-            )
         except Exception as e:
             # Handle unexpected errors during agent processing
             error_response = AgentErrorHandler.handle_unexpected_error(e, 100)
-            await update.message.reply_text(
-                self.escape_markdown_v2(error_response),
-                parse_mode=ParseMode.MARKDOWN_V2,
-            )
+            await update.message.reply_text(error_response)
 
     def run(self, agent: "FinanceAgent") -> None:
         """
@@ -148,10 +175,20 @@ class TelegramInterface:
             print(str(e))
             sys.exit(1)
 
+        # Use the libuv-based event loop for polling when it is available
+        try:
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
         # Create application builder
         try:
             builder = ApplicationBuilder()
             builder.token(token)
+            # Handle different chats concurrently; updates within a chat stay ordered
+            builder.concurrent_updates(_PerChatUpdateProcessor(256))
             app = builder.build()
         except Exception as e:
             error_msg = MessageFormatter.error_message(
@@ -172,13 +209,13 @@ class TelegramInterface:
         )
 
         # Start bot
-        print("🤖 Telegram bot is running...")
-        print(
-            MessageFormatter.info_message(
-                "Send messages to your bot to interact with the Finance Agent"
-            )
+        sys.stdout.write(_STARTUP_BANNER)
+        sys.stdout.flush()
+
+        # Bounded pool so concurrent users cannot flood the OpenAI API
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="finance-agent"
         )
-        print("🔄 Press Ctrl+C to stop the bot")
 
         try:
             app.run_polling()
@@ -193,3 +230,5 @@ class TelegramInterface:
                 )
             )
             sys.exit(1)
+        finally:
+            self.executor.shutdown(wait=False)
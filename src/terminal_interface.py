@@ -14,15 +14,27 @@ Features:
     - Production-ready signal handling
 """
 
+import os
 import sys
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Optional, TYPE_CHECKING
 
+from .agent import AgentResult
 from .error_handler import AgentErrorHandler
 from .feedback import MessageFormatter, WelcomeMessages
 
 if TYPE_CHECKING:
     from .agent import FinanceAgent
 
+# Shared help message, rendered as-is in the terminal (newline included for write())
+_HELP_TEXT = WelcomeMessages.TERMINAL_HELP.strip() + "\n"
+
+# Color support is decided once per process; NO_COLOR (https://no-color.org) opts out
+_COLOR_SUPPORTED = (
+    hasattr(sys.stdout, "isatty")
+    and sys.stdout.isatty()
+    and not os.environ.get("NO_COLOR")
+)
+
 
 class TerminalInterface:
     """
@@ -41,6 +53,9 @@ class TerminalInterface:
         - Production-ready signal and exception handling
     """
 
+    # Rendered welcome banners keyed by use_colors
+    _WELCOME_CACHE: Dict[bool, str] = {}
+
     def __init__(self, use_colors: bool = True):
         """
         Initialize the terminal interface.
@@ -49,72 +64,98 @@ class TerminalInterface:
             use_colors: Whether to use ANSI color codes for enhanced output formatting
         """
         self.use_colors = use_colors and self._supports_color()
-        self.exit_commands = {"quit", "exit", "q", "bye", "goodbye"}
-        self.help_commands = {"help", "h", "?", "commands"}
+
+        # ANSI sequences resolved once; empty strings when colors are disabled
+        colors = self.use_colors
+        self._reset = "\033[0m" if colors else ""
+        self._green_seq = "\033[32m" if colors else ""
+        self._red_seq = "\033[31m" if colors else ""
+        self._blue_seq = "\033[34m" if colors else ""
+        self._yellow_seq = "\033[33m" if colors else ""
+        self._bold_seq = "\033[1m" if colors else ""
+
+        # Input prompt and empty-input warning, shown on every loop iteration
+        self._prompt = f"\n{self._green('💬')} {self._bold('You:')} "
+        self._empty_warning = f"{self._yellow('⚠️')} Please enter a command or type 'help' for assistance."
+
+        # Colored prefixes printed with every agent response
+        self._agent_header = f"\n{self._blue('🤖')} {self._bold('Finance Agent:')}"
+        self._ok_icon = self._green("✅")
+        self._err_icon = self._red("❌")
+        self._tech_prefix = f"{self._red('🔧')} {self._yellow('Technical details:')}"
+
+        # The banner only depends on use_colors; build each variant once per process
+        if self.use_colors not in self._WELCOME_CACHE:
+            self._WELCOME_CACHE[self.use_colors] = self._build_welcome()
+        self._welcome_text = self._WELCOME_CACHE[self.use_colors]
+
+        self.exit_commands = frozenset({"quit", "exit", "q", "bye", "goodbye"})
+        self.help_commands = frozenset({"help", "h", "?", "commands"})
+
+        # Single lookup table mapping each command word to its action
+        self._command_actions: Dict[str, str] = {
+            **dict.fromkeys(self.exit_commands, "exit"),
+            **dict.fromkeys(self.help_commands, "help"),
+        }
 
     def _supports_color(self) -> bool:
         """Check if terminal supports ANSI color codes."""
-        return hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
+        return _COLOR_SUPPORTED
 
-    def _colorize(self, text: str, color_code: str) -> str:
-        """Apply ANSI color codes to text if colors are enabled."""
+    def _style(self, text: str, *codes: str) -> str:
+        """Apply several SGR codes to text using a single combined escape sequence."""
         if not self.use_colors:
             return text
-        return f"\033[{color_code}m{text}\033[0m"
+        return f"\033[{';'.join(codes)}m{text}\033[0m"
 
     def _green(self, text: str) -> str:
         """Apply green color to text."""
-        return self._colorize(text, "32")
+        return self._green_seq + text + self._reset
 
     def _red(self, text: str) -> str:
         """Apply red color to text."""
-        return self._colorize(text, "31")
+        return self._red_seq + text + self._reset
 
     def _blue(self, text: str) -> str:
         """Apply blue color to text."""
-        return self._colorize(text, "34")
+        return self._blue_seq + text + self._reset
 
     def _yellow(self, text: str) -> str:
         """Apply yellow color to text."""
-        return self._colorize(text, "33")
+        return self._yellow_seq + text + self._reset
 
     def _bold(self, text: str) -> str:
         """Apply bold formatting to text."""
-        return self._colorize(text, "1")
+        return self._bold_seq + text + self._reset
 
-    def display_welcome(self) -> None:
-        """
-        Display welcome message with usage instructions.
-
-        Shows the application header, available functionality, and example commands
-        to help users get started with the finance tracker.
-        """
+    def _build_welcome(self) -> str:
+        """Build the full welcome screen text for this instance's color setting."""
         # Use shared welcome message with terminal-specific formatting
-        welcome_lines = WelcomeMessages.TERMINAL_WELCOME.strip().split("\n")
+        welcome = WelcomeMessages.TERMINAL_WELCOME.strip()
 
         # Add header with colored formatting
         header = f"""
-{self._bold(self._blue("=" * 70))}
-{self._bold(self._blue("        Personal Finance Tracker Agent"))}
-{self._bold(self._blue("=" * 70))}
+{self._style("=" * 70, "1", "34")}
+{self._style("        Personal Finance Tracker Agent", "1", "34")}
+{self._style("=" * 70, "1", "34")}
         """
-        print(header)
+        footer = self._style("-" * 70, "1", "34")
+        return header + "\n" + welcome + "\n" + footer + "\n"
 
-        # Print the shared welcome message
-        for line in welcome_lines:
-            print(line)
+    def display_welcome(self) -> None:
+        """
+        Display welcome message with usage instructions.
 
-        print(f"{self._bold(self._blue('-' * 70))}")
+        Shows the application header, available functionality, and example commands
+        to help users get started with the finance tracker.
+        """
+        sys.stdout.write(self._welcome_text)
 
     def display_help(self) -> None:
         """
         Display help information for available commands and functionality.
         """
-        # Use shared help message with terminal-specific formatting
-        help_lines = WelcomeMessages.TERMINAL_HELP.strip().split("\n")
-
-        for line in help_lines:
-            print(line)
+        sys.stdout.write(_HELP_TEXT)
 
     def get_user_input(self) -> Optional[str]:
         """
@@ -132,23 +173,21 @@ class TerminalInterface:
         try:
             while True:
                 # Display prompt
-                user_input = input(
-                    f"\n{self._green('💬')} {self._bold('You:')} "
-                ).strip()
+                user_input = input(self._prompt).strip()
 
                 # Handle empty input
                 if not user_input:
-                    print(
-                        f"{self._yellow('⚠️')} Please enter a command or type 'help' for assistance."
-                    )
+                    print(self._empty_warning)
                     continue
 
+                action = self._command_actions.get(user_input.lower())
+
                 # Check for exit commands
-                if user_input.lower() in self.exit_commands:
+                if action == "exit":
                     return None
 
                 # Check for help commands
-                if user_input.lower() in self.help_commands:
+                if action == "help":
                     self.display_help()
                     continue
 
@@ -167,12 +206,12 @@ class TerminalInterface:
             )
             return None
 
-    def display_response(self, response: Dict[str, Any], verbose: bool = False) -> None:
+    def display_response(self, response: AgentResult, verbose: bool = False) -> None:
         """
         Format and display the agent's response.
 
         Args:
-            response: Dictionary containing the agent's response with keys:
+            response: AgentResult with the agent's response:
                      - success: Boolean indicating execution success
                      - output: Agent's response message
                      - error: Error details if execution failed
@@ -180,22 +219,20 @@ class TerminalInterface:
 
         Formats the response with appropriate colors and icons based on success status.
         """
-        print(f"\n{self._blue('🤖')} {self._bold('Finance Agent:')}")
+        print(self._agent_header)
 
         # Use shared error handler to process response
         output, is_success, error = AgentErrorHandler.process_agent_response(response)
 
         if is_success:
-            print(f"{self._green('✅')} {output}")
+            print(f"{self._ok_icon} {output}")
         else:
-            print(f"{self._red('❌')} {output}")
+            print(f"{self._err_icon} {output}")
 
             # Show technical details if appropriate
             if AgentErrorHandler.should_show_technical_details(error, verbose):
                 formatted_error = AgentErrorHandler.format_error_details(error)
-                print(
-                    f"{self._red('🔧')} {self._yellow('Technical details:')} {formatted_error}"
-                )
+                print(f"{self._tech_prefix} {formatted_error}")
 
     def display_goodbye(self) -> None:
         """
@@ -276,11 +313,7 @@ class TerminalInterface:
                 except Exception as e:
                     # Handle unexpected errors during agent processing
                     error_msg = AgentErrorHandler.handle_unexpected_error(e)
-                    error_response = {
-                        "success": False,
-                        "output": error_msg,
-                        "error": str(e),
-                    }
+                    error_response = AgentResult(False, error_msg, error=str(e))
                     self.display_response(error_response, verbose)
 
         except KeyboardInterrupt:
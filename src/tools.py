@@ -1,13 +1,51 @@
 from langchain_core.tools import tool
-import json
 from datetime import datetime
 from pydantic import BaseModel
-from src.schema import ExpenseInput, MainCategory, SubCategory
+from src.schema import (
+    ExpenseInput,
+    MAIN_CATEGORIES,
+    SUB_CATEGORIES,
+    MAIN_CATEGORY_VALUES,
+    SUB_CATEGORY_VALUES,
+)
 import pandas as pd
 import os
+import threading
+import csv
+import io
+from functools import lru_cache
 
 CSV_PATH = "data/expenses.csv"
 
+# Column order of the CSV, matching the ExpenseInput field order
+CSV_FIELDS = tuple(ExpenseInput.model_fields)
+
+# Low-cardinality label columns are loaded as categoricals for cheaper grouping
+_CATEGORY_DTYPES = {
+    "main_category": "category",
+    "sub_category": "category",
+    "account": "category",
+}
+
+# Requests may be processed concurrently (Telegram), so writes to the CSV are serialized
+_CSV_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _load_expenses(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse the expenses CSV. Cached per file version (path, mtime, size)."""
+    return pd.read_csv(path, dtype=_CATEGORY_DTYPES)
+
+
+def _read_expenses() -> pd.DataFrame:
+    """Return the expenses as a DataFrame, re-parsing the CSV only when it changed.
+
+    The cached frame itself is returned, so callers must treat it as read-only
+    (filter, group or serialize it, but never assign into it).
+    """
+    stat = os.stat(CSV_PATH)
+    return _load_expenses(CSV_PATH, stat.st_mtime_ns, stat.st_size)
+
 
 # Weather tool
 @tool
@@ -34,8 +72,8 @@ def get_current_date_tool() -> str:
 def get_allowed_categories() -> dict[str, list[str]]:
     """Get allowed categories for expenses."""
     return {
-        "main_categories": [category.value for category in MainCategory],
-        "sub_categories": [category.value for category in SubCategory],
+        "main_categories": list(MAIN_CATEGORIES),
+        "sub_categories": list(SUB_CATEGORIES),
     }
 
 
@@ -52,11 +90,10 @@ def get_all_expenses() -> str:
     if not os.path.exists(CSV_PATH) or os.path.getsize(CSV_PATH) == 0:
         return "No expenses found."
 
-    df = pd.read_csv(CSV_PATH)
+    df = _read_expenses()
 
-    # Convert DataFrame to JSON string
-    expenses_json = df.to_json(orient="records", date_format="iso")
-    return json.dumps(json.loads(expenses_json), indent=2)
+    # Convert DataFrame to an indented JSON string in a single pass
+    return df.to_json(orient="records", date_format="iso", indent=2)
 
 
 @tool
@@ -65,15 +102,14 @@ def get_monthly_expenses(month: int):
     if not os.path.exists(CSV_PATH) or os.path.getsize(CSV_PATH) == 0:
         return "No expenses found."
 
-    df = pd.read_csv(CSV_PATH)
+    df = _read_expenses()
 
     monthly_expenses = df[df["month"] == month]
 
     if monthly_expenses.empty:
         return f"No expenses found for month {month}."
 
-    expenses_json = monthly_expenses.to_json(orient="records", date_format="iso")
-    return json.dumps(json.loads(expenses_json), indent=2)
+    return monthly_expenses.to_json(orient="records", date_format="iso", indent=2)
 
 
 ######################################################
@@ -94,24 +130,73 @@ def save_expense_tool(expense_input: ExpenseInput) -> str:
         - All restaurant bills, except for lunch at office, should be saved under main_category=RESTAURANT_NIGHT, sub_category=RESTAURANT_ENJOYMENT
 
     """
-    df = pd.DataFrame([expense_input.model_dump()])
-
-    # Check if file exists and has data rows
-    file_has_data = os.path.exists(CSV_PATH) and os.path.getsize(CSV_PATH) > 0
-
-    # Append to CSV with appropriate header
-    df.to_csv(CSV_PATH, mode="a", header=not file_has_data, index=False)
+    row = expense_input.model_dump()
+
+    with _CSV_LOCK:
+        # Check if file exists and has data rows
+        file_has_data = os.path.exists(CSV_PATH) and os.path.getsize(CSV_PATH) > 0
+
+        # Append the single row directly, with a header for a new file
+        with open(CSV_PATH, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            if not file_has_data:
+                writer.writerow(CSV_FIELDS)
+            writer.writerow([row[field] for field in CSV_FIELDS])
+        _load_expenses.cache_clear()
     return (
         f"✅ Expense successfully saved with the following attributes:\n"
         f"📅 Date: {expense_input.year}-{expense_input.month:02d}\n"
-        f"🏷️ Main Category: {expense_input.main_category.value}\n"
-        f"🔖 Sub Category: {expense_input.sub_category.value}\n"
-        f"🏦 Account: {expense_input.account.value}\n"
+        f"🏷️ Main Category: {expense_input.main_category}\n"
+        f"🔖 Sub Category: {expense_input.sub_category}\n"
+        f"🏦 Account: {expense_input.account}\n"
         f"💰 Amount: ${expense_input.amount:.2f}\n"
         f"📝 Note: {expense_input.note if expense_input.note else 'No note provided'}"
     )
 
 
+def _read_last_line(f, data_start: int) -> tuple[int | None, bytes]:
+    """Locate the last non-empty line of an open binary file.
+
+    Args:
+        f: file opened in binary mode
+        data_start: offset of the first data line (just past the header)
+
+    Returns:
+        (offset, line) with the line stripped of its terminator, or (None, b"") if
+        the file holds no line at or after data_start.
+    """
+    end = f.seek(0, os.SEEK_END)
+    block = 4096
+    while True:
+        start = max(data_start, end - block)
+        f.seek(start)
+        chunk = f.read(end - start).rstrip(b"\r\n")
+        if not chunk:
+            return None, b""
+        newline = chunk.rfind(b"\n")
+        if newline != -1:
+            return start + newline + 1, chunk[newline + 1 :]
+        if start == data_start:
+            return start, chunk
+        block *= 2
+
+
+def _format_csv_row(row: list) -> bytes:
+    """Encode a single row the same way save_expense_tool writes it."""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(row)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _rewrite_last_expense(attribute: str, value: str | float) -> pd.Series:
+    """Update the last expense by rewriting the whole file; the caller holds the lock."""
+    # Plain dtypes here: a categorical column would reject a value it has not seen
+    df = pd.read_csv(CSV_PATH)
+    df.at[df.index[-1], attribute] = value
+    df.to_csv(CSV_PATH, index=False)
+    return df.iloc[-1].copy()
+
+
 @tool
 def update_last_expense_attribute(attribute: str, value: str | float) -> str:
     """
@@ -127,36 +212,55 @@ def update_last_expense_attribute(attribute: str, value: str | float) -> str:
 
     print(f"Updating last expense attribute: {attribute} to {value}")
 
-    if not os.path.exists(CSV_PATH) or os.path.getsize(CSV_PATH) == 0:
-        return "❌ No expenses found to update."
-
-    # Read the CSV file
-    df = pd.read_csv(CSV_PATH)
-
-    if len(df) == 0:
-        return "❌ No expenses found to update."
+    # Reject unknown categories before touching the file
+    if attribute == "main_category" and value not in MAIN_CATEGORY_VALUES:
+        return f"❌ '{value}' is not a valid main category."
+    if attribute == "sub_category" and value not in SUB_CATEGORY_VALUES:
+        return f"❌ '{value}' is not a valid sub category."
+
+    # Read-modify-write of the file, so hold the lock throughout
+    with _CSV_LOCK:
+        if not os.path.exists(CSV_PATH) or os.path.getsize(CSV_PATH) == 0:
+            return "❌ No expenses found to update."
+
+        # Only the last line changes, so rewrite it in place instead of the whole file
+        with open(CSV_PATH, "r+b") as f:
+            header = next(csv.reader([f.readline().decode("utf-8")]), [])
+            data_start = f.tell()
+            line_start, line = _read_last_line(f, data_start)
+
+            if line_start is None:
+                return "❌ No expenses found to update."
+
+            if attribute not in header:
+                return (
+                    f"❌ Attribute '{attribute}' does not exist in the expense records."
+                )
+
+            record = next(csv.reader([line.decode("utf-8")]), [])
+            if line.count(b'"') % 2 or len(record) != len(header):
+                # The last record spans several lines (quoted newline in a note)
+                last_expense = None
+            else:
+                record[header.index(attribute)] = value
+                f.seek(line_start)
+                f.truncate()
+                f.write(_format_csv_row(record))
+                last_expense = dict(zip(header, record))
+
+        if last_expense is None:
+            last_expense = _rewrite_last_expense(attribute, value)
+        _load_expenses.cache_clear()
 
-    # Get the last expense details before updating
-    last_expense = df.iloc[-1].copy()
-
-    # Update the specified attribute
-    if attribute in df.columns:
-        df.at[df.index[-1], attribute] = value
-
-        last_expense = df.iloc[-1].copy()
-        df.to_csv(CSV_PATH, index=False)
-
-        return (
-            f"✅ Last expense {attribute} successfully updated to '{value}'.\n"
-            f"📅 Date: {last_expense['year']}-{last_expense['month']:02d}\n"
-            f"🏷️ Main Category: {last_expense['main_category']}\n"
-            f"🔖 Sub Category: {last_expense['sub_category']}\n"
-            f"🏦 Account: {last_expense['account']}\n"
-            f"💰 Amount: ${last_expense['amount']:.2f}\n"
-            f"📝 Note: {last_expense['note'] if last_expense['note'] else 'No note provided'}"
-        )
-    else:
-        return f"❌ Attribute '{attribute}' does not exist in the expense records."
+    return (
+        f"✅ Last expense {attribute} successfully updated to '{value}'.\n"
+        f"📅 Date: {last_expense['year']}-{int(last_expense['month']):02d}\n"
+        f"🏷️ Main Category: {last_expense['main_category']}\n"
+        f"🔖 Sub Category: {last_expense['sub_category']}\n"
+        f"🏦 Account: {last_expense['account']}\n"
+        f"💰 Amount: ${float(last_expense['amount']):.2f}\n"
+        f"📝 Note: {last_expense['note'] if last_expense['note'] else 'No note provided'}"
+    )
 
 
 ######################################################
@@ -174,26 +278,20 @@ def get_spendings_by_year_and_month() -> pd.DataFrame:
     Returns:
         pd.DataFrame: A DataFrame containing the spending data grouped by year and month. With columns: ['date', 'month', 'total_spent', 'average_spent', 'count']
     """
-    df = pd.read_csv(CSV_PATH)
-
-    df["month_number"] = df["month"].astype(int)
-    df["month"] = pd.to_datetime(df["month_number"], format="%m").dt.strftime("%B")
-    df["date"] = pd.to_datetime(
-        df["year"].astype(str) + " " + df["month"], format="%Y %B"
-    )
+    df = _read_expenses()
 
     ### 1. Spending by Year and Month
+    # Group on the integer columns; groupby already sorts by (year, month)
     by_year_month_df = (
-        df.groupby([df["date"].dt.year, df["month_number"], df["month"]])
-        .agg(
-            total_spent=pd.NamedAgg(column="amount", aggfunc="sum"),
-            average_spent=pd.NamedAgg(column="amount", aggfunc="mean"),
-            count=pd.NamedAgg(column="amount", aggfunc="count"),
-        )
-        .sort_index(level=0)
+        df.groupby(["year", "month"])["amount"]
+        .agg(total_spent="sum", average_spent="mean", count="count")
         .reset_index()
+        .rename(columns={"year": "date"})
     )
-    by_year_month_df.drop("month_number", inplace=True, axis=1)
+    # Month names are only needed for the (small) grouped result
+    by_year_month_df["month"] = pd.to_datetime(
+        by_year_month_df["month"], format="%m"
+    ).dt.strftime("%B")
 
     return by_year_month_df
 
@@ -209,19 +307,14 @@ def _spendings_for_month(year: int, month: int, group_cols: list[str]) -> pd.Dat
     Returns:
         pd.DataFrame with columns = group_cols + ["total_spent", "average_spent", "count"]. Empty if no data.
     """
-    df = pd.read_csv(CSV_PATH)
+    df = _read_expenses()
     if df.empty:
         return pd.DataFrame(
             columns=group_cols + ["total_spent", "average_spent", "count"]
         )
 
-    # Build date for filtering (assuming month column stores full month name e.g. 'August')
-    df["month"] = pd.to_datetime(df["month"], format="%m").dt.strftime("%B")
-    df["date"] = pd.to_datetime(
-        df["year"].astype(str) + " " + df["month"], format="%Y %B", errors="coerce"
-    )
-    # Filter by provided year & month integer
-    filtered_df = df[(df["date"].dt.year == year) & (df["date"].dt.month == month)]
+    # Filter by provided year & month integer; both are stored as integers
+    filtered_df = df[(df["year"] == year) & (df["month"] == month)]
 
     if filtered_df.empty:
         return pd.DataFrame(
@@ -229,12 +322,8 @@ def _spendings_for_month(year: int, month: int, group_cols: list[str]) -> pd.Dat
         )
 
     grouped = (
-        filtered_df.groupby(group_cols)
-        .agg(
-            total_spent=pd.NamedAgg(column="amount", aggfunc="sum"),
-            average_spent=pd.NamedAgg(column="amount", aggfunc="mean"),
-            count=pd.NamedAgg(column="amount", aggfunc="count"),
-        )
+        filtered_df.groupby(group_cols, observed=True)["amount"]
+        .agg(total_spent="sum", average_spent="mean", count="count")
         .reset_index()
     )
     return grouped